@@ -8,6 +8,7 @@ This example shows how to:
 3. Properly shut down when done
 """
 
+import threading
 import time
 from pathlib import Path
 from pyonoy import (
@@ -19,6 +20,13 @@ from pyonoy import (
 )
 
 
+def wait_for_plate_event(event: threading.Event, timeout: float = 10.0) -> None:
+    """Block until the plate handler signals that the plate has moved."""
+    if not event.wait(timeout):
+        raise TimeoutError(f"No plate signal within {timeout} s")
+    event.clear()
+
+
 def run_automated_workflow():
     """Run a fully automated measurement workflow."""
 
@@ -30,6 +38,9 @@ def run_automated_workflow():
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Set by the plate handler once a plate has been inserted or removed
+    plate_moved = threading.Event()
+
     # Launch the application in headless mode
     print("Launching Absorbance 96 App in headless mode...")
     sila_config = SiLAConfig(
@@ -62,23 +73,24 @@ def run_automated_workflow():
         # In a real automation scenario, you might signal a robot
         # to insert the plate here instead of waiting for user input
         print("READY FOR PLATE INSERTION")
-        # robot.insert_plate()  # hypothetical robot control
-        time.sleep(2)  # Simulate plate insertion time
+        # robot.insert_plate(on_done=plate_moved.set)  # hypothetical robot control
+        threading.Timer(2, plate_moved.set).start()  # Simulate plate insertion
+        wait_for_plate_event(plate_moved)
 
         print("Performing readout...")
         client.perform_readout()
 
         # Signal plate removal
         print("READY FOR PLATE REMOVAL")
-        # robot.remove_plate()  # hypothetical robot control
-        time.sleep(2)  # Simulate plate removal time
+        # robot.remove_plate(on_done=plate_moved.set)  # hypothetical robot control
+        threading.Timer(2, plate_moved.set).start()  # Simulate plate removal
+        wait_for_plate_event(plate_moved)
 
         # Export results
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         output_file = OUTPUT_DIR / f"results_{timestamp}.csv"
 
-        results = client.get_results(format=ExportFormat.CSV)
-        output_file.write_bytes(results)
+        client.get_results_to_file(output_file, format=ExportFormat.CSV)
         print(f"Results saved: {output_file}")
 
         # Shut down the headless application
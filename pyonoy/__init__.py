@@ -6,23 +6,33 @@ Python utilities for controlling the Byonoy Absorbance 96 plate reader via SiLA2
 
 from .client import (
     Absorbance96Client,
+    AsyncAbsorbance96Client,
     ConnectionConfig,
     ExportFormat,
+    close_shared_clients,
     run_assay,
+    run_assay_async,
 )
 from .launcher import (
     SiLAConfig,
     launch_sila_server,
+    launch_sila_server_async,
+    launch_sila_servers,
     find_absorbance96_app,
 )
 
 __version__ = "0.1.0"
 __all__ = [
     "Absorbance96Client",
+    "AsyncAbsorbance96Client",
     "ConnectionConfig",
     "ExportFormat",
+    "close_shared_clients",
     "run_assay",
+    "run_assay_async",
     "SiLAConfig",
     "launch_sila_server",
+    "launch_sila_server_async",
+    "launch_sila_servers",
     "find_absorbance96_app",
 ]
@@ -116,7 +116,7 @@ def client_main():
     )
     run_parser.add_argument(
         "--format", "-f",
-        choices=["csv", "xlsx", "json", "xml"],
+        choices=[f.name.lower() for f in ExportFormat],
         default="csv",
         help="Output format (default: csv)"
     )
@@ -156,7 +156,7 @@ def client_main():
         results = run_assay(
             protocol_path=args.protocol,
             output_path=args.output,
-            output_format=ExportFormat(args.format),
+            output_format=ExportFormat[args.format.upper()],
             host=args.host,
             port=args.port,
             insecure=args.insecure,
@@ -7,23 +7,54 @@ Note: The Byonoy SiLA2 server consumes the lock on each command.
 Each ApplicationController call requires a fresh LockServer() call beforehand.
 """
 
+import asyncio
+import atexit
+import functools
+import os
+import threading
 import time
 import uuid
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Awaitable, Callable, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
 
+import grpc
 from sila2.client import SilaClient
+from sila2.client.client_observable_command_instance import (
+    ClientObservableCommandInstance,
+)
+from sila2.framework.errors.defined_execution_error import DefinedExecutionError
 
 __all__ = [
     "Absorbance96Client",
+    "AsyncAbsorbance96Client",
     "ConnectionConfig",
     "ExportFormat",
+    "close_shared_clients",
     "run_assay",
+    "run_assay_async",
 ]
 
 
+def _normalize_uri(uri: Union[str, Path]) -> str:
+    """Convert a local path to a file:// URI; pass URIs through unchanged."""
+    if isinstance(uri, str) and uri.startswith(('file://', 'http://', 'https://')):
+        return uri
+    path = str(uri)
+    if not os.path.isabs(path):
+        # Relative paths depend on the current working directory.
+        return Path(path).resolve().as_uri()
+    return _resolve_path_uri(path)
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_path_uri(path: str) -> str:
+    # Path.resolve() hits the filesystem; the same protocol file is
+    # usually loaded many times per session.
+    return Path(path).resolve().as_uri()
+
+
 class ExportFormat(Enum):
     """Supported export formats for results."""
     CSV = "CSV-en"
@@ -39,12 +70,86 @@ class ConnectionConfig:
     port: int = 50051
     insecure: bool = False
     cert_path: Optional[Path] = None
+    lock_id: Optional[str] = None
 
     @property
     def address(self) -> str:
         return f"{self.host}:{self.port}"
 
 
+_shared_clients: dict[tuple, SilaClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _shared_client_key(config: ConnectionConfig) -> tuple:
+    return (config.host, config.port, config.insecure, config.cert_path)
+
+
+def _get_shared_client(config: ConnectionConfig, timeout: float) -> SilaClient:
+    """Return a SilaClient for the config's target, reusing a cached one.
+
+    Building a SilaClient opens a new gRPC channel (TCP connect, TLS
+    handshake, feature discovery), so clients are cached per
+    (host, port, insecure, cert_path) and shared by every
+    Absorbance96Client that connects to the same server. A cached client
+    is only reused if its channel becomes ready within timeout seconds;
+    otherwise it is discarded and ConnectionError is raised.
+    """
+    key = _shared_client_key(config)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+    if client is not None:
+        try:
+            grpc.channel_ready_future(client._channel).result(timeout=timeout)
+        except grpc.FutureTimeoutError:
+            _discard_shared_client(config, client)
+            raise ConnectionError(
+                f"SiLA2 server at {config.address} not reachable"
+            ) from None
+        return client
+
+    root_certs = None
+    if not config.insecure and config.cert_path:
+        root_certs = config.cert_path.read_bytes()
+    client = SilaClient(
+        config.host,
+        config.port,
+        insecure=config.insecure,
+        root_certs=root_certs,
+    )
+    with _shared_clients_lock:
+        shared = _shared_clients.setdefault(key, client)
+    if shared is not client:
+        # Another thread connected to the same server first.
+        client.close()
+    return shared
+
+
+def _discard_shared_client(config: ConnectionConfig, client: SilaClient) -> None:
+    """Remove client from the cache (if still cached) and close it."""
+    key = _shared_client_key(config)
+    with _shared_clients_lock:
+        if _shared_clients.get(key) is client:
+            del _shared_clients[key]
+    client.close()
+
+
+def close_shared_clients() -> None:
+    """Close all cached SiLA2 connections.
+
+    Called automatically at interpreter exit. Clients that were connected
+    before this call must reconnect before issuing further commands.
+    """
+    with _shared_clients_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_shared_clients)
+
+
 class Absorbance96Client:
     """
     Client for controlling Byonoy Absorbance 96 via SiLA2.
@@ -71,39 +176,75 @@ class Absorbance96Client:
     def __init__(self, config: Optional[ConnectionConfig] = None):
         self.config = config or ConnectionConfig()
         self._client: Optional[SilaClient] = None
-        self._lock_id: str = str(uuid.uuid4())
+        self._lock_id: str = self.config.lock_id or str(uuid.uuid4())
         self._lock_timeout: int = 100
+        self._lock_held: bool = False
+        self._lock_metadata: Optional[list] = None
+        self._readout_id: int = 0
+        self._results_cache: dict[tuple[int, ExportFormat], bytes] = {}
+        self.results_cache_max_bytes: int = 8 * 1024 * 1024
 
     def connect(self, retries: int = 10, retry_delay: float = 2.0) -> None:
         """Establish connection to the SiLA2 server.
 
+        If the server is not up yet, retries with exponential backoff
+        (starting at 0.1 s) until it answers or the deadline passes.
+
         Args:
-            retries: Number of connection attempts before giving up.
-            retry_delay: Seconds to wait between attempts.
+            retries: Together with retry_delay, sets the overall deadline
+                (retries * retry_delay seconds) before giving up.
+            retry_delay: Upper bound on the wait between attempts.
+
+        Raises:
+            ConnectionError: If the server does not come up before the deadline.
+            AttributeError: If the server lacks the ApplicationController
+                or LockController feature.
         """
-        root_certs = None
-        if not self.config.insecure and self.config.cert_path:
-            root_certs = self.config.cert_path.read_bytes()
-
-        for attempt in range(1, retries + 1):
+        deadline = time.monotonic() + retries * retry_delay
+        attempt = 0
+        while True:
             try:
-                self._client = SilaClient(
-                    self.config.host,
-                    self.config.port,
-                    insecure=self.config.insecure,
-                    root_certs=root_certs,
-                )
-                return
-            except Exception:
-                if attempt == retries:
-                    raise
-                time.sleep(retry_delay)
+                timeout = max(deadline - time.monotonic(), 0)
+                client = _get_shared_client(self.config, timeout)
+                break
+            except Exception as e:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ConnectionError(
+                        f"SiLA2 server at {self.config.address} not reachable"
+                    ) from e
+                time.sleep(min(retry_delay, 0.1 * 2 ** attempt, remaining))
+                attempt += 1
+        # Outside the retry loop: a server without the expected features
+        # will not grow them by retrying.
+        self._bind(client)
+
+    def _bind(self, client: SilaClient) -> None:
+        """Attach to a SilaClient and cache its feature and command handles."""
+        app = client.ApplicationController
+        lock_controller = client.LockController
+        self._LoadWorkspace = app.LoadWorkspace
+        self._PrepareForReadout = app.PrepareForReadout
+        self._PerformReadout = app.PerformReadout
+        self._ExportResults = app.ExportResults
+        self._GetResults = app.GetResults
+        self._QuitApplication = app.QuitApplication
+        self._LockServer = lock_controller.LockServer
+        self._UnlockServer = lock_controller.UnlockServer
+        self._LockIdentifier = lock_controller.LockIdentifier
+        self._lock_metadata = [self._LockIdentifier(self._lock_id)]
+        self._client = client
 
     def disconnect(self) -> None:
-        """Close the connection to the SiLA2 server."""
-        if self._client:
-            self._client.close()
-            self._client = None
+        """Release the connection to the SiLA2 server.
+
+        The underlying connection is shared and stays open for reuse by
+        later connect() calls; use close_shared_clients() to close it.
+        """
+        self._client = None
+        self._lock_held = False
+        self._lock_metadata = None
+        self._results_cache.clear()
 
     def __enter__(self):
         self.connect()
@@ -119,26 +260,58 @@ class Absorbance96Client:
         return self._client
 
     def _lock_and_metadata(self) -> list:
-        """Acquire a fresh lock and return metadata for the command.
+        """Acquire the lock and return metadata for the command.
 
-        The Byonoy server may or may not auto-release the lock after a
-        command. We unlock first (ignoring errors if not locked), then
-        re-lock to ensure a clean state before each command.
+        A single LockServer call is made; only if the server reports
+        ServerAlreadyLocked (it did not consume the previous lock) do we
+        fall back to unlocking and re-locking.
         """
-        client = self._ensure_connected()
+        self._ensure_connected()
         try:
-            client.LockController.UnlockServer(LockIdentifier=self._lock_id)
-        except Exception:
-            pass
-        client.LockController.LockServer(
-            LockIdentifier=self._lock_id,
-            Timeout=self._lock_timeout,
-        )
-        return [client.LockController.LockIdentifier(self._lock_id)]
+            self._LockServer(
+                LockIdentifier=self._lock_id,
+                Timeout=self._lock_timeout,
+            )
+        except DefinedExecutionError as e:
+            if e.identifier != "ServerAlreadyLocked":
+                raise
+            self._UnlockServer(LockIdentifier=self._lock_id)
+            self._LockServer(
+                LockIdentifier=self._lock_id,
+                Timeout=self._lock_timeout,
+            )
+        self._lock_held = True
+        return self._lock_metadata
+
+    def _invoke(self, op: Callable[[list], Any]) -> Any:
+        """Run an ApplicationController call with lock metadata.
+
+        The lock is treated as consumed once the command has run, whether
+        or not it succeeded. If the lock was lost before the command ran
+        (the server rejects the lock identifier), re-lock and retry once.
+        """
+        metadata = self._lock_and_metadata()
+        try:
+            return op(metadata)
+        except DefinedExecutionError as e:
+            if e.identifier != "InvalidLockIdentifier":
+                raise
+        finally:
+            self._lock_held = False
+
+        metadata = self._lock_and_metadata()
+        try:
+            return op(metadata)
+        finally:
+            self._lock_held = False
 
     # ========== ApplicationController Feature ==========
 
-    def load_workspace(self, uri: Union[str, Path]) -> None:
+    def load_workspace(
+        self,
+        uri: Union[str, Path],
+        wait: bool = True,
+    ) -> Optional[ClientObservableCommandInstance]:
         """
         Load an assay/protocol file from the given URI.
 
@@ -148,19 +321,26 @@ class Absorbance96Client:
                  - Windows: file:///C:/Users/user/protocol.byoa
                  - macOS/Linux: file:///home/user/protocol.byoa
                  HTTP URLs are also supported.
+            wait: If False, return the running command instance instead of
+                  blocking until it finishes. Call get_responses() on it
+                  before issuing the next command.
         """
-        client = self._ensure_connected()
+        self._ensure_connected()
+        uri = _normalize_uri(uri)
 
-        if isinstance(uri, Path):
-            uri = uri.resolve().as_uri()
-        elif not uri.startswith(('file://', 'http://', 'https://')):
-            uri = Path(uri).resolve().as_uri()
-
-        metadata = self._lock_and_metadata()
-        instance = client.ApplicationController.LoadWorkspace(uri, metadata=metadata)
+        self._results_cache.clear()
+        instance = self._invoke(
+            lambda metadata: self._LoadWorkspace(uri, metadata=metadata)
+        )
+        if not wait:
+            return instance
         instance.get_responses()
+        return None
 
-    def prepare_for_readout(self) -> None:
+    def prepare_for_readout(
+        self,
+        wait: bool = True,
+    ) -> Optional[ClientObservableCommandInstance]:
         """
         Prepare the reader for measurement.
 
@@ -168,12 +348,21 @@ class Absorbance96Client:
         of the loaded assay. After successful completion, the plate can be
         inserted into the reader.
 
+        Args:
+            wait: If False, return the running command instance instead of
+                  blocking until it finishes. Call get_responses() on it
+                  before issuing the next command.
+
         Requires: load_workspace() must be called first.
         """
-        client = self._ensure_connected()
-        metadata = self._lock_and_metadata()
-        instance = client.ApplicationController.PrepareForReadout(metadata=metadata)
+        self._ensure_connected()
+        instance = self._invoke(
+            lambda metadata: self._PrepareForReadout(metadata=metadata)
+        )
+        if not wait:
+            return instance
         instance.get_responses()
+        return None
 
     def perform_readout(self) -> None:
         """
@@ -183,10 +372,12 @@ class Absorbance96Client:
 
         Requires: prepare_for_readout() must be called first.
         """
-        client = self._ensure_connected()
-        metadata = self._lock_and_metadata()
-        instance = client.ApplicationController.PerformReadout(metadata=metadata)
-        instance.get_responses()
+        self._ensure_connected()
+        self._readout_id += 1
+        self._results_cache.clear()
+        self._invoke(
+            lambda metadata: self._PerformReadout(metadata=metadata).get_responses()
+        )
 
     def export_results(
         self,
@@ -202,16 +393,16 @@ class Absorbance96Client:
 
         Requires: perform_readout() must be called first.
         """
-        client = self._ensure_connected()
+        self._ensure_connected()
 
         if isinstance(output_path, Path):
             output_path = str(output_path)
 
-        metadata = self._lock_and_metadata()
-        instance = client.ApplicationController.ExportResults(
-            format.value, output_path, metadata=metadata
+        self._invoke(
+            lambda metadata: self._ExportResults(
+                format.value, output_path, metadata=metadata
+            ).get_responses()
         )
-        instance.get_responses()
 
     def get_results(self, format: ExportFormat = ExportFormat.CSV) -> bytes:
         """
@@ -223,21 +414,214 @@ class Absorbance96Client:
         Returns:
             Binary data of the results file
 
+        Results of the current readout are cached per format, so repeated
+        calls do not transfer the payload again. Payloads larger than
+        results_cache_max_bytes are not cached.
+
         Requires: perform_readout() must be called first.
         """
-        client = self._ensure_connected()
-        metadata = self._lock_and_metadata()
-        return client.ApplicationController.GetResults(format.value, metadata=metadata)
+        key = (self._readout_id, format)
+        cached = self._results_cache.get(key)
+        if cached is not None:
+            return cached
+
+        results = self._fetch_results(format)
+        if len(results) <= self.results_cache_max_bytes:
+            self._results_cache[key] = results
+        return results
+
+    def _fetch_results(self, format: ExportFormat) -> bytes:
+        self._ensure_connected()
+        # Commands return a namedtuple of responses; GetResults has a
+        # single Binary response.
+        response = self._invoke(
+            lambda metadata: self._GetResults(format.value, metadata=metadata)
+        )
+        return response[0]
+
+    def get_results_to_file(
+        self,
+        path: Union[str, Path],
+        format: ExportFormat = ExportFormat.CSV,
+    ) -> None:
+        """
+        Retrieve measurement results and write them to a local file.
+
+        Unlike export_results(), which saves on the server machine, this
+        writes on the client. Results already cached by get_results() are
+        reused; otherwise they are fetched without being added to the cache.
+
+        Args:
+            path: Local path for the results file.
+            format: Export format (CSV, PDF).
+
+        Requires: perform_readout() must be called first.
+        """
+        data = self._results_cache.get((self._readout_id, format))
+        if data is None:
+            data = self._fetch_results(format)
+        with open(path, "wb") as f:
+            f.write(data)
 
     def quit_application(self) -> None:
         """
         Shut down the Absorbance 96 application.
 
         This is the only way to close the app when running in headless mode.
+        The shared connection to the server is closed and this client is
+        disconnected; call connect() again after relaunching the app.
         """
         client = self._ensure_connected()
-        metadata = self._lock_and_metadata()
-        client.ApplicationController.QuitApplication(metadata=metadata)
+        self._invoke(
+            lambda metadata: self._QuitApplication(metadata=metadata)
+        )
+        _discard_shared_client(self.config, client)
+        self.disconnect()
+
+    # ========== Workflows ==========
+
+    def execute_assay(
+        self,
+        uri: Union[str, Path],
+        format: ExportFormat = ExportFormat.CSV,
+        output_path: Optional[Union[str, Path]] = None,
+        on_plate_insert: Optional[Callable[[], None]] = None,
+        on_plate_remove: Optional[Callable[[], None]] = None,
+    ) -> Optional[bytes]:
+        """
+        Run load, prepare, readout and result retrieval as one call.
+
+        The ApplicationController feature has no combined command, so the
+        steps are issued back to back on the current connection.
+
+        Args:
+            uri: Path or URI to the protocol file (see load_workspace()).
+            format: Export format for the results.
+            output_path: If provided, export results to this path on the
+                server instead of returning them.
+            on_plate_insert: Called after prepare_for_readout(); should
+                return once the plate is in the reader.
+            on_plate_remove: Called after perform_readout(); should return
+                once the plate has been removed.
+
+        Returns:
+            The results as bytes, or None if output_path was given.
+        """
+        self.load_workspace(uri)
+        self.prepare_for_readout()
+        if on_plate_insert:
+            on_plate_insert()
+        self.perform_readout()
+        if on_plate_remove:
+            on_plate_remove()
+
+        if output_path:
+            self.export_results(output_path, format)
+            return None
+        return self.get_results(format)
+
+
+class AsyncAbsorbance96Client:
+    """
+    asyncio interface to Absorbance96Client.
+
+    Each command runs the blocking SiLA2 call in a worker thread, so one
+    event loop can drive several readers (or other instruments) at once.
+    Commands on a single client must still be awaited one at a time.
+
+    Example:
+        >>> async with AsyncAbsorbance96Client() as client:
+        ...     await client.load_workspace("file:///C:/protocols/assay.byoa")
+        ...     await client.prepare_for_readout()
+        ...     await client.perform_readout()
+        ...     results = await client.get_results()
+    """
+
+    def __init__(self, config: Optional[ConnectionConfig] = None):
+        self._sync = Absorbance96Client(config)
+
+    @property
+    def config(self) -> ConnectionConfig:
+        return self._sync.config
+
+    async def connect(self, retries: int = 10, retry_delay: float = 2.0) -> None:
+        """Establish connection to the SiLA2 server (see Absorbance96Client.connect)."""
+        await asyncio.to_thread(self._sync.connect, retries, retry_delay)
+
+    async def disconnect(self) -> None:
+        """Release the connection to the SiLA2 server."""
+        self._sync.disconnect()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disconnect()
+        return False
+
+    async def load_workspace(self, uri: Union[str, Path]) -> None:
+        """Load an assay/protocol file from the given URI."""
+        await asyncio.to_thread(self._sync.load_workspace, uri)
+
+    async def prepare_for_readout(self) -> None:
+        """Prepare the reader for measurement."""
+        await asyncio.to_thread(self._sync.prepare_for_readout)
+
+    async def perform_readout(self) -> None:
+        """Perform the measurement as defined by the loaded protocol."""
+        await asyncio.to_thread(self._sync.perform_readout)
+
+    async def export_results(
+        self,
+        output_path: Union[str, Path],
+        format: ExportFormat = ExportFormat.CSV,
+    ) -> None:
+        """Export measurement results to a file on the server machine."""
+        await asyncio.to_thread(self._sync.export_results, output_path, format)
+
+    async def get_results(self, format: ExportFormat = ExportFormat.CSV) -> bytes:
+        """Retrieve measurement results as binary data."""
+        return await asyncio.to_thread(self._sync.get_results, format)
+
+    async def get_results_to_file(
+        self,
+        path: Union[str, Path],
+        format: ExportFormat = ExportFormat.CSV,
+    ) -> None:
+        """Retrieve measurement results and write them to a local file."""
+        await asyncio.to_thread(self._sync.get_results_to_file, path, format)
+
+    async def quit_application(self) -> None:
+        """Shut down the Absorbance 96 application."""
+        await asyncio.to_thread(self._sync.quit_application)
+
+    async def execute_assay(
+        self,
+        uri: Union[str, Path],
+        format: ExportFormat = ExportFormat.CSV,
+        output_path: Optional[Union[str, Path]] = None,
+        on_plate_insert: Optional[Callable[[], Awaitable[None]]] = None,
+        on_plate_remove: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> Optional[bytes]:
+        """
+        Run load, prepare, readout and result retrieval as one call.
+
+        Same as Absorbance96Client.execute_assay(), but the plate-handling
+        callbacks are coroutine functions.
+        """
+        await self.load_workspace(uri)
+        await self.prepare_for_readout()
+        if on_plate_insert:
+            await on_plate_insert()
+        await self.perform_readout()
+        if on_plate_remove:
+            await on_plate_remove()
+
+        if output_path:
+            await self.export_results(output_path, format)
+            return None
+        return await self.get_results(format)
 
 
 def run_assay(
@@ -267,20 +651,51 @@ def run_assay(
     """
     config = ConnectionConfig(host=host, port=port, insecure=insecure)
 
+    on_plate_insert = on_plate_remove = None
+    if interactive:
+        on_plate_insert = lambda: input("Press Enter when plate is inserted...")
+        on_plate_remove = lambda: input("Press Enter when plate is removed...")
+
     with Absorbance96Client(config) as client:
-        client.load_workspace(protocol_path)
-        client.prepare_for_readout()
+        return client.execute_assay(
+            protocol_path,
+            format=output_format,
+            output_path=output_path,
+            on_plate_insert=on_plate_insert,
+            on_plate_remove=on_plate_remove,
+        )
 
-        if interactive:
-            input("Press Enter when plate is inserted...")
 
-        client.perform_readout()
+async def run_assay_async(
+    protocol_path: Union[str, Path],
+    output_path: Optional[Union[str, Path]] = None,
+    output_format: ExportFormat = ExportFormat.CSV,
+    host: str = "127.0.0.1",
+    port: int = 50051,
+    insecure: bool = False,
+    interactive: bool = True,
+) -> Optional[bytes]:
+    """
+    asyncio version of run_assay().
 
-        if interactive:
-            input("Press Enter when plate is removed...")
+    Takes the same arguments and returns the same value. Interactive
+    prompts are read in a worker thread so the event loop is not blocked.
+    """
+    config = ConnectionConfig(host=host, port=port, insecure=insecure)
 
-        if output_path:
-            client.export_results(output_path, output_format)
-            return None
-        else:
-            return client.get_results(output_format)
+    on_plate_insert = on_plate_remove = None
+    if interactive:
+        async def on_plate_insert():
+            await asyncio.to_thread(input, "Press Enter when plate is inserted...")
+
+        async def on_plate_remove():
+            await asyncio.to_thread(input, "Press Enter when plate is removed...")
+
+    async with AsyncAbsorbance96Client(config) as client:
+        return await client.execute_assay(
+            protocol_path,
+            format=output_format,
+            output_path=output_path,
+            on_plate_insert=on_plate_insert,
+            on_plate_remove=on_plate_remove,
+        )
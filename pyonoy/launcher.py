@@ -4,22 +4,53 @@ Byonoy Absorbance 96 SiLA2 Server Launcher
 Utility to start the Absorbance 96 App with SiLA2 server enabled.
 """
 
-import subprocess
-import platform
+import functools
 import os
+import sys
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
-__all__ = ["SiLAConfig", "launch_sila_server", "find_absorbance96_app"]
+if TYPE_CHECKING:
+    import asyncio.subprocess
+    import subprocess
 
+__all__ = [
+    "SiLAConfig",
+    "launch_sila_server",
+    "launch_sila_server_async",
+    "launch_sila_servers",
+    "find_absorbance96_app",
+]
 
-@dataclass
+# Shared by the SiLAConfig default and _CLI_SPEC, so configs that keep the
+# default pass the equality check in to_cli_args() on identity alone.
+_DEFAULT_IP = "127.0.0.1"
+
+# (attribute, flag, is_bool, default) for each SiLAConfig option; an option
+# is passed only when it differs from the app's own default.
+_CLI_SPEC = (
+    ("port", "--sila-port", False, 50051),
+    ("ip", "--sila-ip", False, _DEFAULT_IP),
+    ("insecure", "--sila-insecure", True, False),
+    ("headless", "--headless", True, False),
+    ("uuid", "--sila-uuid", False, None),
+    ("ca_cert", "--sila-ca-cert", False, None),
+    ("cert", "--sila-cert", False, None),
+    ("key", "--sila-key", False, None),
+    ("out_cert", "--sila-out-cert", False, None),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class SiLAConfig:
-    """Configuration for SiLA2 server startup."""
+    """Configuration for SiLA2 server startup.
+
+    Instances are immutable; use dataclasses.replace() to derive a variant.
+    """
     
     port: int = 50051
-    ip: str = "127.0.0.1"
+    ip: str = _DEFAULT_IP
     insecure: bool = False
     headless: bool = False
     uuid: Optional[str] = None
@@ -30,64 +61,140 @@ class SiLAConfig:
 
     def to_cli_args(self) -> list[str]:
         """Convert config to CLI arguments."""
-        args = ["--sila"]
-        
-        if self.port != 50051:
-            args.extend(["--sila-port", str(self.port)])
-        if self.ip != "127.0.0.1":
-            args.extend(["--sila-ip", self.ip])
-        if self.insecure:
-            args.append("--sila-insecure")
-        if self.headless:
-            args.append("--headless")
-        if self.uuid:
-            args.extend(["--sila-uuid", self.uuid])
-        if self.ca_cert:
-            args.extend(["--sila-ca-cert", str(self.ca_cert)])
-        if self.cert:
-            args.extend(["--sila-cert", str(self.cert)])
-        if self.key:
-            args.extend(["--sila-key", str(self.key)])
-        if self.out_cert:
-            args.extend(["--sila-out-cert", str(self.out_cert)])
-        
-        return args
+        return list(_compute_cli_args(self))
+
+
+@functools.lru_cache(maxsize=32)
+def _compute_cli_args(config: SiLAConfig) -> tuple[str, ...]:
+    args = ["--sila"]
+    append = args.append
+    for attr, flag, is_bool, default in _CLI_SPEC:
+        value = getattr(config, attr)
+        if value == default:
+            continue
+        append(flag)
+        if not is_bool:
+            append(str(value))
+    return tuple(args)
+
+
+# Same names as platform.system() for the supported OSes, derived from
+# sys.platform so that importing this module does not pull in platform.
+_SYSTEM = {"win32": "Windows", "darwin": "Darwin"}.get(sys.platform, sys.platform)
+
 
+def _windows_candidates() -> list[Path]:
+    app = Path("Byonoy") / "Absorbance 96 App" / "app" / "absorbance96app.exe"
+    return [
+        Path(os.environ.get("PROGRAMFILES(X86)", "C:/Program Files (x86)")) / app,
+        Path(os.environ.get("PROGRAMFILES", "C:/Program Files")) / app,
+        Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / app,
+    ]
 
+
+def _macos_candidates() -> list[Path]:
+    return [
+        Path("/Applications/Absorbance 96 App.app"),
+        Path.home() / "Applications" / "Absorbance 96 App.app",
+    ]
+
+
+# Install locations are built once at import, and only for this OS:
+# Path.home() can raise where no home directory is set.
+_CANDIDATE_FACTORIES = {
+    "Windows": _windows_candidates,
+    "Darwin": _macos_candidates,
+}
+
+# (string path, Path) pairs for this OS, probed with os.path directly to
+# avoid the pathlib wrapper on each check. The Windows app is an .exe
+# file, the macOS app a .app bundle directory.
+_CANDIDATE_STRS = tuple(
+    (str(p), p) for p in _CANDIDATE_FACTORIES.get(_SYSTEM, list)()
+)
+_CANDIDATE_EXISTS = {
+    "Windows": os.path.isfile,
+    "Darwin": os.path.isdir,
+}.get(_SYSTEM, os.path.exists)
+
+
+@functools.lru_cache(maxsize=1)
 def find_absorbance96_app() -> Optional[Path]:
     """
     Attempt to locate the Absorbance 96 App installation.
+
+    The result is cached for the lifetime of the process; call
+    find_absorbance96_app.cache_clear() to search again.
     
     Returns:
         Path to the executable if found, None otherwise.
     """
-    system = platform.system()
-    
-    if system == "Windows":
-        candidates = [
-            Path(os.environ.get("PROGRAMFILES(X86)", "C:/Program Files (x86)")) / "Byonoy" / "Absorbance 96 App" / "app" / "absorbance96app.exe",
-            Path(os.environ.get("PROGRAMFILES", "C:/Program Files")) / "Byonoy" / "Absorbance 96 App" / "app" / "absorbance96app.exe",
-            Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "Byonoy" / "Absorbance 96 App" / "app" / "absorbance96app.exe",
-        ]
-    elif system == "Darwin":
-        candidates = [
-            Path("/Applications/Absorbance 96 App.app"),
-            Path.home() / "Applications" / "Absorbance 96 App.app",
-        ]
-    else:
-        return None
-    
-    for candidate in candidates:
-        if candidate.exists():
+    for candidate_str, candidate in _CANDIDATE_STRS:
+        if _CANDIDATE_EXISTS(candidate_str):
             return candidate
     return None
 
 
+def _resolve_app_path(app_path: Optional[Path]) -> Path:
+    if app_path is None:
+        app_path = find_absorbance96_app()
+        if app_path is None:
+            raise FileNotFoundError(
+                "Could not find Absorbance 96 App. Please specify the path manually."
+            )
+    return app_path
+
+
+def _build_cmd_windows(
+    app_path: Path, cli_args: list[str], new_instance: bool = False
+) -> list:
+    # Every start of the .exe is its own process.
+    return [str(app_path), *cli_args]
+
+
+def _build_cmd_darwin(
+    app_path: Path, cli_args: list[str], new_instance: bool = False
+) -> list:
+    # Without -n, open activates an already running instance and drops
+    # --args.
+    cmd = ["/usr/bin/open"]
+    if new_instance:
+        cmd.append("-n")
+    return [*cmd, str(app_path), "--args", *cli_args]
+
+
+def _build_cmd_unsupported(
+    app_path: Path, cli_args: list[str], new_instance: bool = False
+) -> list:
+    raise OSError(f"Unsupported operating system: {_SYSTEM}")
+
+
+# Command builder for this OS, chosen once at import.
+_BUILD_CMD = {
+    "Windows": _build_cmd_windows,
+    "Darwin": _build_cmd_darwin,
+}.get(_SYSTEM, _build_cmd_unsupported)
+
+
+def _spawn(
+    config: SiLAConfig,
+    app_path: Path,
+    capture: bool,
+    new_instance: bool = False,
+) -> "subprocess.Popen":
+    import subprocess
+
+    cmd = _BUILD_CMD(app_path, config.to_cli_args(), new_instance)
+    output = subprocess.PIPE if capture else subprocess.DEVNULL
+    return subprocess.Popen(cmd, stdout=output, stderr=output)
+
+
 def launch_sila_server(
     config: Optional[SiLAConfig] = None,
     app_path: Optional[Path] = None,
     wait: bool = False,
-) -> subprocess.Popen:
+    capture: bool = False,
+) -> "subprocess.Popen":
     """
     Launch the Absorbance 96 App with SiLA2 server enabled.
     
@@ -95,6 +202,10 @@ def launch_sila_server(
         config: SiLA server configuration (uses defaults if None)
         app_path: Path to the application (auto-detected if None)
         wait: If True, wait for the process to complete
+        capture: If True, pipe the app's stdout/stderr so they can be read
+            from the returned process; otherwise they are discarded.
+            Cannot be combined with wait=True; call
+            process.communicate() on the result instead.
         
     Returns:
         The subprocess.Popen object for the launched application
@@ -102,34 +213,101 @@ def launch_sila_server(
     Raises:
         FileNotFoundError: If the application cannot be found
         OSError: If running on an unsupported operating system
+        ValueError: If both wait and capture are True
     """
+    if wait and capture:
+        raise ValueError(
+            "wait=True would discard captured output; "
+            "use process.communicate() instead"
+        )
+
     if config is None:
         config = SiLAConfig()
     
-    if app_path is None:
-        app_path = find_absorbance96_app()
-        if app_path is None:
-            raise FileNotFoundError(
-                "Could not find Absorbance 96 App. Please specify the path manually."
-            )
-    
-    system = platform.system()
-    cli_args = config.to_cli_args()
-    
-    if system == "Windows":
-        cmd = [str(app_path)] + cli_args
-    elif system == "Darwin":
-        cmd = ["open", str(app_path), "--args"] + cli_args
-    else:
-        raise OSError(f"Unsupported operating system: {system}")
-    
-    process = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
+    process = _spawn(config, _resolve_app_path(app_path), capture)
     
     if wait:
         process.wait()
     
     return process
+
+
+async def launch_sila_server_async(
+    config: Optional[SiLAConfig] = None,
+    app_path: Optional[Path] = None,
+    capture: bool = False,
+) -> "asyncio.subprocess.Process":
+    """
+    Launch the Absorbance 96 App from a running asyncio event loop.
+
+    Same as launch_sila_server(), but the process is spawned through the
+    event loop so other tasks keep running meanwhile. Await
+    process.wait() on the result to wait for the app to exit.
+    
+    Args:
+        config: SiLA server configuration (uses defaults if None)
+        app_path: Path to the application (auto-detected if None)
+        capture: If True, pipe the app's stdout/stderr so they can be read
+            from the returned process; otherwise they are discarded
+        
+    Returns:
+        The asyncio.subprocess.Process for the launched application
+        
+    Raises:
+        FileNotFoundError: If the application cannot be found
+        OSError: If running on an unsupported operating system
+    """
+    import asyncio.subprocess
+
+    if config is None:
+        config = SiLAConfig()
+    
+    app_path = _resolve_app_path(app_path)
+    cmd = _BUILD_CMD(app_path, config.to_cli_args())
+    
+    output = asyncio.subprocess.PIPE if capture else asyncio.subprocess.DEVNULL
+    return await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=output,
+        stderr=output,
+    )
+
+
+def launch_sila_servers(
+    configs: Sequence[SiLAConfig],
+    app_path: Optional[Path] = None,
+    capture: bool = False,
+) -> "list[subprocess.Popen]":
+    """
+    Launch one Absorbance 96 App instance per config, e.g. one per reader.
+
+    The application is located once for the whole batch. On macOS each
+    config gets its own app instance (open -n). If a launch fails, the
+    processes already started by this call are terminated before the
+    error is raised.
+    
+    Args:
+        configs: SiLA server configurations, typically with distinct ports
+        app_path: Path to the application (auto-detected if None)
+        capture: If True, pipe each app's stdout/stderr
+        
+    Returns:
+        The subprocess.Popen objects, in the order of configs
+        
+    Raises:
+        FileNotFoundError: If the application cannot be found
+        OSError: If running on an unsupported operating system
+    """
+    app_path = _resolve_app_path(app_path)
+    processes = []
+    try:
+        for config in configs:
+            processes.append(
+                _spawn(config, app_path, capture, new_instance=True)
+            )
+    except BaseException:
+        for process in processes:
+            process.terminate()
+            process.wait()
+        raise
+    return processes
@@ -1,14 +1,29 @@
-"""Tests for byonoy_absorbance96 package."""
+"""Tests for pyonoy package."""
 
+import asyncio.subprocess
+import dataclasses
+import os
+import subprocess
+from collections import namedtuple
+import grpc
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
-from byonoy_absorbance96 import (
+import pyonoy.client
+import pyonoy.launcher
+from pyonoy import (
     Absorbance96Client,
+    AsyncAbsorbance96Client,
     ConnectionConfig,
     ExportFormat,
     SiLAConfig,
+    close_shared_clients,
+    run_assay,
+    run_assay_async,
+    launch_sila_server,
+    launch_sila_server_async,
+    launch_sila_servers,
 )
 
 
@@ -46,6 +61,56 @@ class TestSiLAConfig:
         assert "--headless" in args
         assert "--sila-uuid" in args
         assert "test-uuid" in args
+    
+    def test_cli_args_follow_spec_order(self):
+        config = SiLAConfig(
+            port=50052,
+            ip="0.0.0.0",
+            insecure=True,
+            headless=True,
+            uuid="test-uuid",
+            ca_cert=Path("ca.pem"),
+            cert=Path("cert.pem"),
+            key=Path("key.pem"),
+            out_cert=Path("out.pem"),
+        )
+        assert config.to_cli_args() == [
+            "--sila",
+            "--sila-port", "50052",
+            "--sila-ip", "0.0.0.0",
+            "--sila-insecure",
+            "--headless",
+            "--sila-uuid", "test-uuid",
+            "--sila-ca-cert", "ca.pem",
+            "--sila-cert", "cert.pem",
+            "--sila-key", "key.pem",
+            "--sila-out-cert", "out.pem",
+        ]
+    
+    def test_cli_spec_covers_all_fields(self):
+        fields = [f.name for f in dataclasses.fields(SiLAConfig)]
+        assert [spec[0] for spec in pyonoy.launcher._CLI_SPEC] == fields
+    
+    def test_cli_args_memoized(self):
+        pyonoy.launcher._compute_cli_args.cache_clear()
+        
+        SiLAConfig(port=50052).to_cli_args()
+        SiLAConfig(port=50052).to_cli_args()
+        
+        info = pyonoy.launcher._compute_cli_args.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+    
+    def test_cli_args_returns_fresh_list(self):
+        config = SiLAConfig(port=50052)
+        args = config.to_cli_args()
+        args.append("--extra")
+        assert config.to_cli_args() == ["--sila", "--sila-port", "50052"]
+    
+    def test_frozen(self):
+        config = SiLAConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.port = 50052
+        assert dataclasses.replace(config, port=50052).port == 50052
 
 
 class TestConnectionConfig:
@@ -66,10 +131,9 @@ class TestExportFormat:
     """Tests for ExportFormat enum."""
     
     def test_values(self):
-        assert ExportFormat.CSV.value == "csv"
-        assert ExportFormat.XLSX.value == "xlsx"
-        assert ExportFormat.JSON.value == "json"
-        assert ExportFormat.XML.value == "xml"
+        assert ExportFormat.CSV.value == "CSV-en"
+        assert ExportFormat.CSV_DE.value == "CSV-de"
+        assert ExportFormat.PDF.value == "PDF"
 
 
 class TestAbsorbance96Client:
@@ -91,20 +155,28 @@ class TestAbsorbance96Client:
         with pytest.raises(RuntimeError, match="Not connected"):
             client._ensure_connected()
     
-    def test_ensure_locked_raises(self):
+    def test_lock_id_per_client(self):
+        assert Absorbance96Client()._lock_id != Absorbance96Client()._lock_id
+    
+    def test_lock_id_from_config(self):
+        client = Absorbance96Client(ConnectionConfig(lock_id="my-lock"))
+        assert client._lock_id == "my-lock"
+    
+    def test_lock_requires_connection(self):
         client = Absorbance96Client()
-        client.channel = Mock()  # Fake connection
-        with pytest.raises(RuntimeError, match="No lock held"):
-            client._ensure_locked()
+        with pytest.raises(RuntimeError, match="Not connected"):
+            client._lock_and_metadata()
     
     def test_load_workspace_converts_path(self):
         client = Absorbance96Client()
-        client.channel = Mock()
-        client._lock_id = "test-lock"
+        sila_client = Mock()
+        client._bind(sila_client)
         
-        # Should not raise - path conversion works
         path = Path("C:/test/protocol.byop")
         client.load_workspace(path)
+        
+        uri = sila_client.ApplicationController.LoadWorkspace.call_args.args[0]
+        assert uri == path.resolve().as_uri()
     
     def test_context_manager(self):
         client = Absorbance96Client(ConnectionConfig(insecure=True))
@@ -115,15 +187,21 @@ class TestAbsorbance96Client:
                     mock_connect.assert_called_once()
                 mock_disconnect.assert_called_once()
     
-    def test_lock_context_manager(self):
+    def test_lock_metadata_uses_lock_id(self):
         client = Absorbance96Client()
-        client.channel = Mock()
+        sila_client = Mock()
+        client._bind(sila_client)
         
-        with client.lock() as lock_id:
-            assert lock_id is not None
-            assert client._lock_id == lock_id
+        metadata = client._lock_and_metadata()
         
-        assert client._lock_id is None
+        sila_client.LockController.LockServer.assert_called_once_with(
+            LockIdentifier=client._lock_id,
+            Timeout=client._lock_timeout,
+        )
+        sila_client.LockController.LockIdentifier.assert_called_once_with(
+            client._lock_id
+        )
+        assert metadata == [sila_client.LockController.LockIdentifier.return_value]
 
 
 class TestURIConversion:
@@ -131,18 +209,749 @@ class TestURIConversion:
     
     def test_path_to_uri_windows(self):
         client = Absorbance96Client()
-        client.channel = Mock()
-        client._lock_id = "test"
+        sila_client = Mock()
+        client._bind(sila_client)
         
-        # Path objects get converted
+        # Path objects get converted to file:// URIs
         path = Path("C:/Users/test/protocol.byop")
-        # This would internally convert to file:///C:/Users/test/protocol.byop
+        client.load_workspace(path)
+        uri = sila_client.ApplicationController.LoadWorkspace.call_args.args[0]
+        assert uri.startswith("file://")
+        assert uri == path.resolve().as_uri()
     
     def test_string_uri_passthrough(self):
         client = Absorbance96Client()
-        client.channel = Mock()
-        client._lock_id = "test"
+        sila_client = Mock()
+        client._bind(sila_client)
+        load = sila_client.ApplicationController.LoadWorkspace
         
         # URIs starting with file:// or http:// pass through
         client.load_workspace("file:///C:/test.byop")
+        assert load.call_args.args[0] == "file:///C:/test.byop"
         client.load_workspace("https://example.com/test.byop")
+        assert load.call_args.args[0] == "https://example.com/test.byop"
+
+
+class TestConnect:
+    """Tests for Absorbance96Client.connect()."""
+    
+    def teardown_method(self, method):
+        close_shared_clients()
+    
+    def test_secure_with_cert(self, tmp_path):
+        cert = tmp_path / "ca.pem"
+        cert.write_bytes(b"CERT")
+        client = Absorbance96Client(ConnectionConfig(cert_path=cert))
+        
+        with patch("pyonoy.client.SilaClient") as sila_client:
+            client.connect()
+        
+        sila_client.assert_called_once_with(
+            "127.0.0.1", 50051, insecure=False, root_certs=b"CERT"
+        )
+        assert client._client is sila_client.return_value
+    
+    def test_secure_without_cert(self):
+        client = Absorbance96Client(ConnectionConfig())
+        
+        with patch("pyonoy.client.SilaClient") as sila_client:
+            client.connect()
+        
+        # Without a certificate, SilaClient picks the default roots itself
+        # (including the Windows certificate store).
+        sila_client.assert_called_once_with(
+            "127.0.0.1", 50051, insecure=False, root_certs=None
+        )
+    
+    def test_retries_until_server_is_up(self):
+        client = Absorbance96Client(ConnectionConfig(insecure=True))
+        
+        with patch("pyonoy.client.SilaClient") as sila_client, \
+                patch("pyonoy.client.time.sleep") as sleep:
+            sila_client.side_effect = [OSError("refused"), Mock()]
+            client.connect()
+        
+        assert sila_client.call_count == 2
+        sleep.assert_called_once()
+        assert sleep.call_args.args[0] <= 0.1
+    
+    def test_raises_connection_error_after_deadline(self):
+        client = Absorbance96Client(ConnectionConfig(insecure=True))
+        
+        with patch("pyonoy.client.SilaClient", side_effect=OSError("refused")):
+            with pytest.raises(ConnectionError, match="not reachable"):
+                client.connect(retries=0)
+    
+    def test_missing_feature_not_retried(self):
+        client = Absorbance96Client(ConnectionConfig(insecure=True))
+        server = Mock(spec=["LockController", "close"])
+        
+        with patch("pyonoy.client.SilaClient", return_value=server) as sila_client, \
+                patch("pyonoy.client.time.sleep") as sleep:
+            with pytest.raises(AttributeError):
+                client.connect()
+        
+        sila_client.assert_called_once()
+        sleep.assert_not_called()
+        assert client._client is None
+
+
+class TestSharedClients:
+    """Tests for the shared SilaClient cache."""
+    
+    def teardown_method(self, method):
+        close_shared_clients()
+    
+    def test_reuses_ready_client(self):
+        config = ConnectionConfig(insecure=True)
+        
+        with patch("pyonoy.client.SilaClient") as sila_client, \
+                patch("pyonoy.client.grpc.channel_ready_future") as ready:
+            first = Absorbance96Client(config)
+            first.connect()
+            second = Absorbance96Client(config)
+            second.connect()
+        
+        sila_client.assert_called_once()
+        ready.assert_called_once_with(sila_client.return_value._channel)
+        assert second._client is first._client
+    
+    def test_discards_client_that_is_not_ready(self):
+        config = ConnectionConfig(insecure=True)
+        stale, fresh = Mock(), Mock()
+        
+        with patch("pyonoy.client.SilaClient", side_effect=[stale, fresh]), \
+                patch("pyonoy.client.grpc.channel_ready_future") as ready:
+            Absorbance96Client(config).connect()
+            ready.return_value.result.side_effect = grpc.FutureTimeoutError()
+            with pytest.raises(ConnectionError):
+                Absorbance96Client(config).connect(retries=0)
+            stale.close.assert_called_once()
+            
+            client = Absorbance96Client(config)
+            client.connect()
+        
+        assert client._client is fresh
+    
+    def test_quit_application_discards_client(self):
+        config = ConnectionConfig(insecure=True)
+        stale, fresh = Mock(), Mock()
+        
+        with patch("pyonoy.client.SilaClient", side_effect=[stale, fresh]):
+            client = Absorbance96Client(config)
+            client.connect()
+            client.quit_application()
+            
+            stale.ApplicationController.QuitApplication.assert_called_once()
+            stale.close.assert_called_once()
+            assert client._client is None
+            
+            client.connect()
+        
+        assert client._client is fresh
+    
+    def test_concurrent_connect_keeps_one_client(self):
+        config = ConnectionConfig(insecure=True)
+        winner, loser = Mock(), Mock()
+        
+        def build_while_other_thread_wins(*args, **kwargs):
+            pyonoy.client._shared_clients[
+                pyonoy.client._shared_client_key(config)
+            ] = winner
+            return loser
+        
+        with patch(
+            "pyonoy.client.SilaClient", side_effect=build_while_other_thread_wins
+        ):
+            client = pyonoy.client._get_shared_client(config, timeout=1)
+        
+        assert client is winner
+        loser.close.assert_called_once()
+
+
+class FakeDefinedError(Exception):
+    """Stand-in for sila2's DefinedExecutionError."""
+    
+    def __init__(self, identifier):
+        super().__init__(identifier)
+        self.identifier = identifier
+
+
+class TestLocking:
+    """Tests for lock handling around ApplicationController commands."""
+    
+    def setup_method(self, method):
+        self._patch = patch("pyonoy.client.DefinedExecutionError", FakeDefinedError)
+        self._patch.start()
+        self.sila_client = Mock()
+        self.lock_controller = self.sila_client.LockController
+        self.app = self.sila_client.ApplicationController
+        self.client = Absorbance96Client()
+        self.client._bind(self.sila_client)
+    
+    def teardown_method(self, method):
+        self._patch.stop()
+    
+    def test_one_lock_call_per_command(self):
+        self.client.prepare_for_readout()
+        self.client.perform_readout()
+        
+        assert self.lock_controller.LockServer.call_count == 2
+        self.lock_controller.UnlockServer.assert_not_called()
+        first = self.app.PrepareForReadout.call_args.kwargs["metadata"]
+        second = self.app.PerformReadout.call_args.kwargs["metadata"]
+        assert first is second
+    
+    def test_lock_released_after_failed_command(self):
+        self.app.PrepareForReadout.side_effect = FakeDefinedError("DeviceError")
+        with pytest.raises(FakeDefinedError):
+            self.client.prepare_for_readout()
+        assert not self.client._lock_held
+        
+        self.client.perform_readout()
+        
+        assert self.lock_controller.LockServer.call_count == 2
+        assert not self.client._lock_held
+    
+    def test_locked_by_other_client_not_retried(self):
+        self.lock_controller.LockServer.side_effect = FakeDefinedError(
+            "ServerAlreadyLocked"
+        )
+        self.lock_controller.UnlockServer.side_effect = FakeDefinedError(
+            "InvalidLockIdentifier"
+        )
+        
+        with pytest.raises(FakeDefinedError):
+            self.client.perform_readout()
+        
+        self.lock_controller.LockServer.assert_called_once()
+        self.lock_controller.UnlockServer.assert_called_once()
+        self.app.PerformReadout.assert_not_called()
+    
+    def test_relock_when_server_already_locked(self):
+        self.lock_controller.LockServer.side_effect = [
+            FakeDefinedError("ServerAlreadyLocked"),
+            None,
+        ]
+        
+        self.client.perform_readout()
+        
+        self.lock_controller.UnlockServer.assert_called_once_with(
+            LockIdentifier=self.client._lock_id
+        )
+        assert self.lock_controller.LockServer.call_count == 2
+    
+    def test_lock_errors_other_than_already_locked_propagate(self):
+        self.lock_controller.LockServer.side_effect = OSError("unavailable")
+        
+        with pytest.raises(OSError):
+            self.client.perform_readout()
+        
+        self.lock_controller.UnlockServer.assert_not_called()
+        self.app.PerformReadout.assert_not_called()
+    
+    def test_retry_once_on_invalid_lock_identifier(self):
+        self.app.PerformReadout.side_effect = [
+            FakeDefinedError("InvalidLockIdentifier"),
+            Mock(),
+        ]
+        
+        self.client.perform_readout()
+        
+        assert self.app.PerformReadout.call_count == 2
+        assert self.lock_controller.LockServer.call_count == 2
+    
+    def test_no_retry_on_other_defined_errors(self):
+        self.app.PerformReadout.side_effect = FakeDefinedError("DeviceError")
+        
+        with pytest.raises(FakeDefinedError):
+            self.client.perform_readout()
+        
+        self.app.PerformReadout.assert_called_once()
+    
+    def test_no_wait_returns_running_instance(self):
+        instance = self.client.load_workspace(
+            "http://example.com/assay.byoa", wait=False
+        )
+        assert instance is self.app.LoadWorkspace.return_value
+        instance.get_responses.assert_not_called()
+        assert not self.client._lock_held
+        
+        instance = self.client.prepare_for_readout(wait=False)
+        assert instance is self.app.PrepareForReadout.return_value
+        instance.get_responses.assert_not_called()
+        assert not self.client._lock_held
+        assert self.lock_controller.LockServer.call_count == 2
+    
+    def test_wait_blocks_on_responses(self):
+        assert self.client.prepare_for_readout() is None
+        self.app.PrepareForReadout.return_value.get_responses.assert_called_once()
+    
+    def test_no_retry_when_message_mentions_lock_identifier(self):
+        self.app.PerformReadout.side_effect = RuntimeError("InvalidLockIdentifier")
+        
+        with pytest.raises(RuntimeError):
+            self.client.perform_readout()
+        
+        self.app.PerformReadout.assert_called_once()
+
+
+GetResultsResponses = namedtuple("GetResults_Responses", ["Results"])
+
+
+class TestResults:
+    """Tests for result retrieval and caching."""
+    
+    def setup_method(self, method):
+        self.sila_client = Mock()
+        self.get_results = self.sila_client.ApplicationController.GetResults
+        self.get_results.return_value = GetResultsResponses(b"A1,0.5\n")
+        self.client = Absorbance96Client()
+        self.client._bind(self.sila_client)
+    
+    def test_get_results_to_file_writes_payload(self, tmp_path):
+        output = tmp_path / "results.csv"
+        
+        self.client.get_results_to_file(output)
+        
+        assert output.read_bytes() == b"A1,0.5\n"
+        self.get_results.assert_called_once()
+        assert self.client._results_cache == {}
+    
+    def test_readout_then_save_locally(self, tmp_path):
+        # The sequence used by examples/assay_script.py.
+        output = tmp_path / "results.csv"
+        
+        self.client.load_workspace("http://example.com/assay.byoa")
+        self.client.prepare_for_readout()
+        self.client.perform_readout()
+        self.client.get_results_to_file(output, format=ExportFormat.CSV)
+        
+        assert output.read_bytes() == b"A1,0.5\n"
+    
+    def test_get_results_to_file_reuses_cached_results(self, tmp_path):
+        self.client.get_results()
+        
+        self.client.get_results_to_file(tmp_path / "results.csv")
+        
+        self.get_results.assert_called_once()
+    
+    def test_get_results_cached_per_format(self):
+        assert self.client.get_results() == b"A1,0.5\n"
+        self.client.get_results()
+        self.client.get_results(ExportFormat.PDF)
+        self.client.get_results(ExportFormat.PDF)
+        
+        formats = [call.args[0] for call in self.get_results.call_args_list]
+        assert formats == ["CSV-en", "PDF"]
+    
+    def test_perform_readout_invalidates_cache(self):
+        self.client.get_results()
+        self.client.perform_readout()
+        self.client.get_results()
+        
+        assert self.get_results.call_count == 2
+    
+    def test_load_workspace_invalidates_cache(self):
+        self.client.get_results()
+        self.client.load_workspace("http://example.com/assay.byoa")
+        self.client.get_results()
+        
+        assert self.get_results.call_count == 2
+    
+    def test_disconnect_invalidates_cache(self):
+        self.client.get_results()
+        self.client.disconnect()
+        
+        assert self.client._results_cache == {}
+    
+    def test_large_results_not_cached(self):
+        self.client.results_cache_max_bytes = 4
+        self.client.get_results()
+        self.client.get_results()
+        
+        assert self.get_results.call_count == 2
+        assert self.client._results_cache == {}
+    
+    def test_limit_applies_to_payload_size(self):
+        self.client.results_cache_max_bytes = len(b"A1,0.5\n")
+        self.client.get_results()
+        self.client.get_results()
+        self.get_results.assert_called_once()
+        
+        self.client.results_cache_max_bytes -= 1
+        self.client.perform_readout()
+        self.client.get_results()
+        self.client.get_results()
+        assert self.get_results.call_count == 3
+
+
+class TestExecuteAssay:
+    """Tests for the combined assay workflow."""
+    
+    def setup_method(self, method):
+        self.client = Absorbance96Client()
+        self.steps = Mock()
+        for name in (
+            "load_workspace",
+            "prepare_for_readout",
+            "perform_readout",
+            "export_results",
+            "get_results",
+        ):
+            setattr(self.client, name, getattr(self.steps, name))
+        self.steps.get_results.return_value = b"A1,0.5\n"
+    
+    def test_returns_results(self):
+        results = self.client.execute_assay("assay.byoa", ExportFormat.PDF)
+        
+        assert results == b"A1,0.5\n"
+        assert self.steps.mock_calls == [
+            call.load_workspace("assay.byoa"),
+            call.prepare_for_readout(),
+            call.perform_readout(),
+            call.get_results(ExportFormat.PDF),
+        ]
+    
+    def test_exports_to_output_path(self):
+        results = self.client.execute_assay(
+            "assay.byoa", output_path="C:/results.csv"
+        )
+        
+        assert results is None
+        assert self.steps.mock_calls[-1] == call.export_results(
+            "C:/results.csv", ExportFormat.CSV
+        )
+        self.steps.get_results.assert_not_called()
+    
+    def test_plate_callbacks_between_steps(self):
+        self.client.execute_assay(
+            "assay.byoa",
+            on_plate_insert=self.steps.on_plate_insert,
+            on_plate_remove=self.steps.on_plate_remove,
+        )
+        
+        assert [c[0] for c in self.steps.mock_calls] == [
+            "load_workspace",
+            "prepare_for_readout",
+            "on_plate_insert",
+            "perform_readout",
+            "on_plate_remove",
+            "get_results",
+        ]
+
+
+class TestRunAssay:
+    """Tests for run_assay()."""
+    
+    def setup_method(self, method):
+        self._patch = patch("pyonoy.client.Absorbance96Client")
+        self.client_cls = self._patch.start()
+        self.client = self.client_cls.return_value.__enter__.return_value
+        self.client.execute_assay.return_value = b"A1,0.5\n"
+    
+    def teardown_method(self, method):
+        self._patch.stop()
+    
+    def test_non_interactive(self):
+        results = run_assay(
+            "assay.byoa",
+            output_format=ExportFormat.PDF,
+            host="192.168.1.100",
+            port=50052,
+            insecure=True,
+            interactive=False,
+        )
+        
+        assert results == b"A1,0.5\n"
+        self.client_cls.assert_called_once_with(
+            ConnectionConfig(host="192.168.1.100", port=50052, insecure=True)
+        )
+        self.client.execute_assay.assert_called_once_with(
+            "assay.byoa",
+            format=ExportFormat.PDF,
+            output_path=None,
+            on_plate_insert=None,
+            on_plate_remove=None,
+        )
+    
+    def test_interactive_prompts(self):
+        run_assay("assay.byoa", output_path="C:/results.csv")
+        
+        kwargs = self.client.execute_assay.call_args.kwargs
+        assert kwargs["output_path"] == "C:/results.csv"
+        with patch("builtins.input") as prompt:
+            kwargs["on_plate_insert"]()
+            kwargs["on_plate_remove"]()
+        assert prompt.call_count == 2
+
+
+class TestAsyncClient:
+    """Tests for the asyncio client."""
+    
+    def setup_method(self, method):
+        self.sila_client = Mock()
+        self.app = self.sila_client.ApplicationController
+        self.app.GetResults.return_value = GetResultsResponses(b"A1,0.5\n")
+        self._patch = patch(
+            "pyonoy.client._get_shared_client", return_value=self.sila_client
+        )
+        self.get_shared_client = self._patch.start()
+    
+    def teardown_method(self, method):
+        self._patch.stop()
+    
+    async def test_commands_delegate_to_sila_client(self):
+        async with AsyncAbsorbance96Client() as client:
+            assert client._sync._client is self.sila_client
+            await client.load_workspace("http://example.com/assay.byoa")
+            await client.prepare_for_readout()
+            await client.perform_readout()
+            assert await client.get_results() == b"A1,0.5\n"
+        
+        assert self.app.LoadWorkspace.call_args.args == (
+            "http://example.com/assay.byoa",
+        )
+        self.app.PrepareForReadout.assert_called_once()
+        self.app.PerformReadout.assert_called_once()
+        assert self.app.GetResults.call_args.args == ("CSV-en",)
+        assert client._sync._client is None
+    
+    async def test_execute_assay_awaits_callbacks(self):
+        steps = []
+        
+        async def on_plate_insert():
+            steps.append(("insert", self.app.PerformReadout.called))
+        
+        async def on_plate_remove():
+            steps.append(("remove", self.app.PerformReadout.called))
+        
+        async with AsyncAbsorbance96Client() as client:
+            results = await client.execute_assay(
+                "http://example.com/assay.byoa",
+                on_plate_insert=on_plate_insert,
+                on_plate_remove=on_plate_remove,
+            )
+        
+        assert results == b"A1,0.5\n"
+        assert steps == [("insert", False), ("remove", True)]
+    
+    async def test_run_assay_async(self):
+        with patch("builtins.input") as prompt:
+            results = await run_assay_async(
+                "http://example.com/assay.byoa", port=50052
+            )
+        
+        assert results == b"A1,0.5\n"
+        assert prompt.call_count == 2
+        assert self.get_shared_client.call_args.args[0].port == 50052
+    
+    async def test_run_assay_async_exports(self):
+        results = await run_assay_async(
+            "http://example.com/assay.byoa",
+            output_path="C:/results.csv",
+            interactive=False,
+        )
+        
+        assert results is None
+        assert self.app.ExportResults.call_args.args == ("CSV-en", "C:/results.csv")
+        self.app.GetResults.assert_not_called()
+
+
+class TestNormalizeURI:
+    """Tests for local path to URI conversion."""
+    
+    def test_relative_path_follows_working_directory(self, tmp_path):
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        
+        cwd = os.getcwd()
+        try:
+            os.chdir(first)
+            assert pyonoy.client._normalize_uri("assay.byoa") == (
+                (first / "assay.byoa").resolve().as_uri()
+            )
+            os.chdir(second)
+            assert pyonoy.client._normalize_uri("assay.byoa") == (
+                (second / "assay.byoa").resolve().as_uri()
+            )
+        finally:
+            os.chdir(cwd)
+    
+    def test_absolute_path_is_cached(self, tmp_path):
+        path = str(tmp_path / "assay.byoa")
+        pyonoy.client._resolve_path_uri.cache_clear()
+        
+        pyonoy.client._normalize_uri(path)
+        pyonoy.client._normalize_uri(path)
+        
+        info = pyonoy.client._resolve_path_uri.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestLaunchSiLAServer:
+    """Tests for launching the app."""
+    
+    def test_wait_with_capture_rejected(self):
+        with patch("subprocess.Popen") as popen:
+            with pytest.raises(ValueError):
+                launch_sila_server(
+                    app_path=Path("app"), wait=True, capture=True
+                )
+        popen.assert_not_called()
+    
+    def test_wait(self):
+        with patch.object(pyonoy.launcher, "_BUILD_CMD", return_value=["app"]):
+            with patch("subprocess.Popen") as popen:
+                process = launch_sila_server(app_path=Path("app"), wait=True)
+        
+        assert process is popen.return_value
+        process.wait.assert_called_once_with()
+    
+    def test_output_discarded_by_default(self):
+        with patch.object(pyonoy.launcher, "_BUILD_CMD", return_value=["app"]):
+            with patch("subprocess.Popen") as popen:
+                launch_sila_server(app_path=Path("app"))
+        
+        popen.assert_called_once_with(
+            ["app"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+    
+    def test_capture_pipes_output(self):
+        with patch.object(pyonoy.launcher, "_BUILD_CMD", return_value=["app"]):
+            with patch("subprocess.Popen") as popen:
+                launch_sila_server(app_path=Path("app"), capture=True)
+        
+        popen.assert_called_once_with(
+            ["app"], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+    
+    async def test_async_launch(self):
+        config = SiLAConfig(port=50052)
+        build = Mock(return_value=["app", "--sila", "--sila-port", "50052"])
+        
+        with patch.object(pyonoy.launcher, "_BUILD_CMD", build):
+            with patch("asyncio.create_subprocess_exec", AsyncMock()) as spawn:
+                process = await launch_sila_server_async(
+                    config, app_path=Path("app")
+                )
+                await launch_sila_server_async(
+                    config, app_path=Path("app"), capture=True
+                )
+        
+        assert process is spawn.return_value
+        build.assert_called_with(Path("app"), config.to_cli_args())
+        assert spawn.call_args_list == [
+            call(
+                "app", "--sila", "--sila-port", "50052",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            ),
+            call(
+                "app", "--sila", "--sila-port", "50052",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            ),
+        ]
+    
+    def test_darwin_new_instance(self):
+        cmd = pyonoy.launcher._build_cmd_darwin(
+            Path("/Applications/A.app"), ["--sila"], new_instance=True
+        )
+        assert cmd == [
+            "/usr/bin/open", "-n", "/Applications/A.app", "--args", "--sila"
+        ]
+        
+        cmd = pyonoy.launcher._build_cmd_darwin(
+            Path("/Applications/A.app"), ["--sila"]
+        )
+        assert cmd == ["/usr/bin/open", "/Applications/A.app", "--args", "--sila"]
+    
+    def test_launch_servers_uses_new_instances(self):
+        configs = [SiLAConfig(port=50051), SiLAConfig(port=50052)]
+        build = Mock(return_value=["app"])
+        with patch.object(pyonoy.launcher, "_BUILD_CMD", build):
+            with patch("subprocess.Popen"):
+                processes = launch_sila_servers(configs, app_path=Path("app"))
+        
+        assert len(processes) == 2
+        assert all(call.args[2] is True for call in build.call_args_list)
+    
+    def test_launch_servers_cleans_up_on_failure(self):
+        started = Mock()
+        configs = [SiLAConfig(port=50051), SiLAConfig(port=50052)]
+        with patch.object(pyonoy.launcher, "_BUILD_CMD", return_value=["app"]):
+            popen = Mock(side_effect=[started, OSError("boom")])
+            with patch("subprocess.Popen", popen):
+                with pytest.raises(OSError):
+                    launch_sila_servers(configs, app_path=Path("app"))
+        
+        started.terminate.assert_called_once_with()
+        started.wait.assert_called_once_with()
+
+
+class TestFindApp:
+    """Tests for locating the app."""
+    
+    def setup_method(self, method):
+        pyonoy.launcher.find_absorbance96_app.cache_clear()
+    
+    def teardown_method(self, method):
+        pyonoy.launcher.find_absorbance96_app.cache_clear()
+    
+    def _candidates(self, *paths):
+        return patch.object(
+            pyonoy.launcher,
+            "_CANDIDATE_STRS",
+            tuple((str(p), p) for p in paths),
+        )
+    
+    def test_macos_candidates_only_built_on_macos(self):
+        with patch("pathlib.Path.home", side_effect=RuntimeError):
+            assert len(pyonoy.launcher._windows_candidates()) == 3
+            with pytest.raises(RuntimeError):
+                pyonoy.launcher._macos_candidates()
+    
+    def test_returns_first_existing_candidate(self, tmp_path):
+        missing = tmp_path / "missing.exe"
+        first = tmp_path / "first.exe"
+        second = tmp_path / "second.exe"
+        first.touch()
+        second.touch()
+        
+        with self._candidates(missing, first, second), patch.object(
+            pyonoy.launcher, "_CANDIDATE_EXISTS", os.path.isfile
+        ):
+            assert pyonoy.launcher.find_absorbance96_app() == first
+    
+    def test_checks_file_type(self, tmp_path):
+        bundle = tmp_path / "Absorbance 96 App.app"
+        bundle.mkdir()
+        
+        with self._candidates(bundle):
+            with patch.object(
+                pyonoy.launcher, "_CANDIDATE_EXISTS", os.path.isfile
+            ):
+                assert pyonoy.launcher.find_absorbance96_app() is None
+            pyonoy.launcher.find_absorbance96_app.cache_clear()
+            with patch.object(
+                pyonoy.launcher, "_CANDIDATE_EXISTS", os.path.isdir
+            ):
+                assert pyonoy.launcher.find_absorbance96_app() == bundle
+    
+    def test_result_is_cached(self, tmp_path):
+        app = tmp_path / "app.exe"
+        exists = Mock(return_value=True)
+        
+        with self._candidates(app), patch.object(
+            pyonoy.launcher, "_CANDIDATE_EXISTS", exists
+        ):
+            assert pyonoy.launcher.find_absorbance96_app() == app
+            assert pyonoy.launcher.find_absorbance96_app() == app
+            exists.assert_called_once_with(str(app))
+            
+            pyonoy.launcher.find_absorbance96_app.cache_clear()
+            pyonoy.launcher.find_absorbance96_app()
+            assert exists.call_count == 2